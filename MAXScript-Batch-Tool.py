@@ -13,43 +13,328 @@
 
 # Dynamic import of PySide2 or PySide6 based on availability
 try:
-    from PySide6.QtCore import Qt, Signal, Slot
+    from PySide6.QtCore import (
+        Qt, Signal, Slot, QObject, QThread, QTimer, QAbstractTableModel, QModelIndex,
+        QRunnable, QThreadPool
+    )
     from PySide6.QtWidgets import (
         QApplication, QLabel, QMenu, QSplitter, QWidget, QVBoxLayout,
-        QGroupBox, QPushButton, QHBoxLayout, QFileDialog, QListWidget,
-        QListWidgetItem, QMessageBox, QCheckBox, QProgressBar, QTextEdit,
-        QAbstractItemView
+        QGroupBox, QPushButton, QHBoxLayout, QFileDialog, QTreeView,
+        QMessageBox, QCheckBox, QProgressBar, QPlainTextEdit,
+        QAbstractItemView, QHeaderView, QSpinBox
     )
-    from PySide6.QtGui import QFont
+    from PySide6.QtGui import QFont, QColor, QTextCharFormat, QTextCursor
     print("Running with PySide6")
 except ImportError:
-    from PySide2.QtCore import Qt, Signal, Slot
+    from PySide2.QtCore import (
+        Qt, Signal, Slot, QObject, QThread, QTimer, QAbstractTableModel, QModelIndex,
+        QRunnable, QThreadPool
+    )
     from PySide2.QtWidgets import (
         QApplication, QLabel, QMenu, QSplitter, QWidget, QVBoxLayout,
-        QGroupBox, QPushButton, QHBoxLayout, QFileDialog, QListWidget,
-        QListWidgetItem, QMessageBox, QCheckBox, QProgressBar, QTextEdit,
-        QAbstractItemView
+        QGroupBox, QPushButton, QHBoxLayout, QFileDialog, QTreeView,
+        QMessageBox, QCheckBox, QProgressBar, QPlainTextEdit,
+        QAbstractItemView, QHeaderView, QSpinBox
     )
-    from PySide2.QtGui import QFont
+    from PySide2.QtGui import QFont, QColor, QTextCharFormat, QTextCursor
     print("Running with PySide2")
 # Importing 'runtime' from pymxs
 from pymxs import runtime
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import codecs
+import collections
+import functools
+import locale
+import mmap
+import subprocess
+import tempfile
+import threading
 import time
 import os
 import re
-from pathlib import Path
 
-class FileListWidget(QListWidget):
+# Matches a quoted path (group 1) or a run of non-whitespace characters (group 2) in a list file
+PATH_PATTERN = re.compile(rb'"([^"]+)"|(\S+)')
+
+# Number of threads used to check file existence, stat latency on network shares overlaps across them
+IO_WORKERS = 32
+
+# Up to this many paths are checked sequentially, handing them to the pool costs more than it saves
+SEQUENTIAL_CHECK_LIMIT = 16
+
+def normalizePath(file_path):
+    """
+    Returns the key used to detect duplicate file paths.
+    normpath and normcase only rewrite the string, unlike abspath which also queries the current directory.
+
+    Args:
+        file_path (str): The file path to normalize.
+
+    Returns:
+        str: The normalized file path.
+    """
+    return os.path.normcase(os.path.normpath(file_path))
+
+def findExistingFiles(paths, executor=None):
+    """
+    Returns the paths that point to existing files.
+    Paths are grouped by directory and each directory holding several of them is listed
+    once with os.scandir, instead of calling stat for every path.
+
+    Args:
+        paths (list): The file paths to check.
+        executor (ThreadPoolExecutor): Optional pool to check the directories in parallel.
+
+    Returns:
+        set: The paths that exist.
+    """
+    paths_by_directory = {}
+    for path in paths:
+        directory, name = os.path.split(path)
+        paths_by_directory.setdefault(directory, []).append((name, path))
+
+    def checkDirectory(directory, entries):
+        if len(entries) == 1:
+            # A single stat is cheaper than listing the directory
+            return [entries[0][1]] if os.path.isfile(entries[0][1]) else []
+        try:
+            with os.scandir(directory or '.') as directory_entries:
+                present = {os.path.normcase(entry.name) for entry in directory_entries if entry.is_file()}
+        except OSError:
+            return []  # Missing or unreadable directory, none of its paths exist
+        return [path for name, path in entries if os.path.normcase(name) in present]
+
+    if executor is not None and len(paths_by_directory) > 1 and len(paths) > SEQUENTIAL_CHECK_LIMIT:
+        results = executor.map(checkDirectory, paths_by_directory.keys(), paths_by_directory.values())
+    else:
+        results = map(checkDirectory, paths_by_directory.keys(), paths_by_directory.values())
+
+    existing_files = set()
+    for found in results:
+        existing_files.update(found)
+    return existing_files
+
+def readListFilePaths(list_file):
+    """
+    Yields the paths found in a list file, with backslashes converted to forward slashes.
+    The file is memory-mapped and matched as bytes, so only the matched paths are decoded.
+
+    Args:
+        list_file (str): The list file to read.
+
+    Yields:
+        str: Each path in the list file.
+    """
+    with open(list_file, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return  # An empty file cannot be memory-mapped
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            # Decode like text mode does, unless the file starts with a UTF-8 byte order mark
+            if content[:3] == codecs.BOM_UTF8:
+                encoding, start = 'utf-8', 3
+            else:
+                encoding, start = locale.getpreferredencoding(False), 0
+            for match in PATH_PATTERN.finditer(content, start):
+                path = match.group(1) or match.group(2)
+                yield path.decode(encoding, 'replace').replace('\\', '/')
+
+@functools.lru_cache(maxsize=16)
+def parseListFile(list_file, modified_time, size):
+    """
+    Returns the 3ds Max and MAXScript paths listed in a list file.
+    Results are cached per file version, so browsing the same unchanged list file again skips parsing it.
+    The modification time and size are only part of the cache key: editing the file gives a new key.
+
+    Args:
+        list_file (str): The list file to read.
+        modified_time (int): Modification time of the list file, in nanoseconds.
+        size (int): Size of the list file, in bytes.
+
+    Returns:
+        tuple: A tuple of the 3ds Max paths and a tuple of the MAXScript paths, in list order.
+    """
+    max_files = []
+    ms_files = []
+    # Classify each path in a single pass, with one suffix lookup per path
+    files_by_extension = {'.max': max_files, '.ms': ms_files}
+    for path in readListFilePaths(list_file):
+        files = files_by_extension.get(os.path.splitext(path)[1].lower())
+        if files is not None:
+            files.append(path)
+    return tuple(max_files), tuple(ms_files)
+
+class PathListModel(QAbstractTableModel):
+    """
+    Table model holding file paths in a plain Python list and showing them in
+    "File Name" and "Directory" columns. Each path is split once when added,
+    and no item object is created per file.
+    """
+    HEADERS = ("File Name", "Directory")
+    ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled | Qt.ItemNeverHasChildren
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.paths = []  # File paths, in list order
+        self.path_parts = []  # (file name, directory) of each path, the displayed columns
+        self.normalized_paths = set()  # Normalized file paths, used to detect duplicates
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.paths)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.path_parts[index.row()][index.column()]
+        if role == Qt.UserRole or role == Qt.ToolTipRole:
+            return self.paths[index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled  # Drops land between rows, items can be reordered but not nested
+        return self.ITEM_FLAGS  # Combined once, the view queries the flags of every row
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def addPaths(self, paths):
+        """
+        Appends the paths that are not in the model yet, with a single row insertion.
+
+        Args:
+            paths (list): The file paths to add.
+
+        Returns:
+            list: The paths that were skipped as duplicates.
+        """
+        normalized_paths = self.normalized_paths
+        new_paths = []
+        duplicates = []
+        for file_path in paths:
+            normalized_path = normalizePath(file_path)
+            if normalized_path in normalized_paths:
+                duplicates.append(file_path)
+            else:
+                normalized_paths.add(normalized_path)
+                new_paths.append(file_path)
+
+        if new_paths:
+            first = len(self.paths)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_paths) - 1)
+            self.paths.extend(new_paths)
+            self.path_parts.extend(os.path.split(file_path)[::-1] for file_path in new_paths)
+            self.endInsertRows()
+        return duplicates
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or count <= 0 or row < 0 or row + count > len(self.paths):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        for file_path in self.paths[row:row + count]:
+            self.normalized_paths.discard(normalizePath(file_path))
+        del self.paths[row:row + count]
+        del self.path_parts[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    def removePathRows(self, rows):
+        """
+        Removes the given rows, one removal per run of contiguous rows.
+
+        Args:
+            rows (list): The rows to remove.
+        """
+        # Remove from the bottom up, so the rows still to be removed keep their positions
+        rows = sorted(set(rows), reverse=True)
+        index = 0
+        while index < len(rows):
+            end = start = rows[index]
+            index += 1
+            while index < len(rows) and rows[index] == start - 1:
+                start = rows[index]
+                index += 1
+            self.removeRows(start, end - start + 1)
+
+    def clear(self):
+        """
+        Removes all paths.
+        """
+        self.beginResetModel()
+        self.paths.clear()
+        self.path_parts.clear()
+        self.normalized_paths.clear()
+        self.endResetModel()
+
+    def movePaths(self, rows, destination):
+        """
+        Moves the given rows, keeping their order, so they start at the destination row.
+
+        Args:
+            rows (list): The rows to move.
+            destination (int): The row to move them before, counted before the move.
+        """
+        rows = sorted(set(rows))
+        if not rows:
+            return
+        moved_rows = set(rows)
+        remaining = [row for row in range(len(self.paths)) if row not in moved_rows]
+        destination -= sum(1 for row in rows if row < destination)
+        new_order = remaining[:destination] + rows + remaining[destination:]  # Old row of each new row
+
+        self.layoutAboutToBeChanged.emit()
+        self.paths[:] = [self.paths[row] for row in new_order]
+        self.path_parts[:] = [self.path_parts[row] for row in new_order]
+        new_rows = {old_row: new_row for new_row, old_row in enumerate(new_order)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes, [self.index(new_rows[index.row()], index.column()) for index in old_indexes]
+        )
+        self.layoutChanged.emit()
+
+class FileListWidget(QTreeView):
     """
-    Custom QListWidget to handle drag-and-drop of files and key events.
+    Custom QTreeView listing the files of a PathListModel in "File Name" and "Directory" columns,
+    handling drag-and-drop of files and key events.
     """
     fileDropped = Signal(list)  # Signal to emit when files are dropped
     removeRequested = Signal()  # Signal to emit when remove is requested via Delete key
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.path_model = PathListModel(self)
+        self.setModel(self.path_model)
+        self.setRootIsDecorated(False)
+        self.setUniformRowHeights(True)
+        self.header().setSectionResizeMode(QHeaderView.Interactive)  # Columns are fitted once per added batch, see fitColumns
+        self.header().setStretchLastSection(False)
         self.setAcceptDrops(True)
-        self.setDragDropMode(QListWidget.InternalMove)
+        self.setDragDropMode(QAbstractItemView.InternalMove)
+
+    def fitColumns(self):
+        """
+        Resizes the columns to their contents. Called once after a batch of items is added,
+        instead of letting the header re-measure every row on each insertion.
+        """
+        for column in range(self.path_model.columnCount()):
+            self.resizeColumnToContents(column)
+
+    def selectedRows(self):
+        """
+        Returns the selected rows in ascending order.
+
+        Returns:
+            list: The selected row numbers.
+        """
+        return sorted(index.row() for index in self.selectionModel().selectedRows())
 
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
@@ -73,6 +358,22 @@ class FileListWidget(QListWidget):
             if files:
                 self.fileDropped.emit(files)
             event.acceptProposedAction()
+        elif event.source() is self:
+            # Reorder the paths in the model directly instead of through a mime data round trip
+            position = event.position().toPoint() if hasattr(event, 'position') else event.pos()
+            index = self.indexAt(position)
+            if not index.isValid() or self.dropIndicatorPosition() == QAbstractItemView.OnViewport:
+                destination = self.path_model.rowCount()
+            elif self.dropIndicatorPosition() == QAbstractItemView.BelowItem:
+                destination = index.row() + 1
+            else:
+                destination = index.row()
+            self.path_model.movePaths(self.selectedRows(), destination)
+            # The rows are already moved. Report no action, so the drag does not finish as a move
+            # and the view does not remove the (moved) selected rows afterwards. A copy would not work:
+            # InternalMove strips CopyAction from the drag, and Qt turns it back into a move.
+            event.setDropAction(Qt.IgnoreAction)
+            event.accept()
         else:
             super(FileListWidget, self).dropEvent(event)
 
@@ -84,17 +385,456 @@ class FileListWidget(QListWidget):
             event (QKeyEvent): The key event.
         """
         if event.key() in (Qt.Key_Delete, Qt.Key_Backspace):
-            if self.selectedItems():
+            if self.selectionModel().hasSelection():
                 self.removeRequested.emit()
         else:
             super(FileListWidget, self).keyPressEvent(event)
 
+class ListFileLoaderSignals(QObject):
+    """
+    Signals of a ListFileLoader. QRunnable is not a QObject, so it cannot declare them itself.
+    """
+    finished = Signal(object)  # Tuple of the new 3ds Max files, the new MAXScript files and the number already listed
+    failed = Signal(str)  # Error message if the list file could not be read
+
+class ListFileLoader(QRunnable):
+    """
+    Reads a list file and checks which of the listed files exist on a QThreadPool thread,
+    so large list files and slow network shares do not block the GUI.
+    """
+    def __init__(self, list_file, max_listed, ms_listed, io_pool):
+        """
+        Args:
+            list_file (str): The list file to read.
+            max_listed (frozenset): Normalized paths already in the 3ds Max files list.
+            ms_listed (frozenset): Normalized paths already in the MAXScript files list.
+            io_pool (ThreadPoolExecutor): Pool used for the file existence checks.
+        """
+        super().__init__()
+        self.setAutoDelete(False)  # The FileBrowser keeps the loader alive until its signals are delivered
+        self.signals = ListFileLoaderSignals()
+        self.list_file = list_file
+        self.max_listed = max_listed
+        self.ms_listed = ms_listed
+        self.io_pool = io_pool
+
+    def run(self):
+        # Any failure must still be reported, otherwise the FileBrowser keeps its list file buttons disabled
+        try:
+            list_file_stat = os.stat(self.list_file)
+            max_files, ms_files = parseListFile(self.list_file, list_file_stat.st_mtime_ns, list_file_stat.st_size)
+
+            # Paths already in the lists were checked when they were added, leave them out before any stat
+            new_max_files = [path for path in max_files if normalizePath(path) not in self.max_listed]
+            new_ms_files = [path for path in ms_files if normalizePath(path) not in self.ms_listed]
+            listed_count = len(max_files) + len(ms_files) - len(new_max_files) - len(new_ms_files)
+
+            # Check existence of all paths at once, spreading the directories over the I/O pool.
+            # This is not cached, the listed files may have been created or deleted since the last browse.
+            existing_files = findExistingFiles(new_max_files + new_ms_files, self.io_pool)
+            max_files = [path for path in new_max_files if path in existing_files]
+            ms_files = [path for path in new_ms_files if path in existing_files]
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit((max_files, ms_files, listed_count))
+
+class ProcessingAborted(Exception):
+    """
+    Raised by the BatchWorker loops when an abort is requested.
+    Carries the current step and the total number of steps.
+    """
+
+class BatchWorker(QObject):
+    """
+    Runs the batch loop on a worker thread and reports back to the GUI through signals.
+    pymxs may only be used from the main thread, so every runtime call is dispatched
+    back to it through invokeRequested and the worker waits for the result.
+    """
+    progress = Signal(int, int, float)  # Signal to emit current step, total steps and start time
+    logMessage = Signal(str, str)  # Signal to emit a log message and its level
+    finished = Signal(str)  # Signal to emit when processing ends, with "completed", "aborted" or "failed"
+    invokeRequested = Signal(object, bool)  # Signal to run a callable on the main thread, True to paint the current step first
+    PROGRESS_INTERVAL = 0.2  # Minimum number of seconds between progress signals, 5 updates per second is plenty to read
+
+    def __init__(self, max_script_files, max_files, save_max_file, abort_event, io_pool, parent=None):
+        super().__init__(parent)
+        self.max_script_files = max_script_files
+        self.max_files = max_files
+        self.save_max_file = save_max_file
+        self.abort_event = abort_event  # threading.Event set from the GUI thread by the "Abort" button
+        self.io_pool = io_pool  # Shared ThreadPoolExecutor for file existence checks
+        self.errors_occurred = False  # Flag to track if any errors occurred
+        self.last_progress_emit = 0.0  # Monotonic time of the last progress signal
+
+    def callOnMainThread(self, func, *args, paint=False, **kwargs):
+        """
+        Runs a callable on the main thread and blocks until it returns.
+
+        Args:
+            func (callable): The callable to run, usually a pymxs runtime function.
+            paint (bool): Whether to paint the log and progress first. Set for long calls, which block the GUI until they return.
+
+        Returns:
+            The value returned by the callable. Exceptions are re-raised in the worker.
+        """
+        result = {}
+
+        def call():
+            try:
+                result['value'] = func(*args, **kwargs)
+            except Exception as e:
+                result['error'] = e
+
+        self.invokeRequested.emit(call, paint)
+        if 'error' in result:
+            raise result['error']
+        return result.get('value')
+
+    def runMaxScriptFile(self, max_script_file):
+        """
+        Executes a MAXScript file. Must be called on the main thread.
+
+        Args:
+            max_script_file (str): The MAXScript file to execute.
+
+        Returns:
+            bool: True if the script requested an abort through g_abortRequested.
+        """
+        runtime.fileIn(max_script_file)
+        return bool(runtime.g_abortRequested)
+
+    def reportProgress(self, current_step, total_steps, start_time, force=False):
+        """
+        Sends the progress to the GUI thread, at most once per PROGRESS_INTERVAL seconds.
+
+        Args:
+            current_step (int): The current step in the process.
+            total_steps (int): The total number of steps in the process.
+            start_time (float): The time when processing started.
+            force (bool): Send the progress even if the interval has not elapsed.
+        """
+        now = time.monotonic()
+        if force or now - self.last_progress_emit >= self.PROGRESS_INTERVAL:
+            self.last_progress_emit = now
+            self.progress.emit(current_step, total_steps, start_time)
+
+    def log(self, message, level="INFO"):
+        """
+        Sends a log message to the GUI thread.
+
+        Args:
+            message (str): The message to log.
+            level (str): The logging level.
+        """
+        self.logMessage.emit(message, level)
+
+    @Slot()
+    def run(self):
+        """
+        Runs the batch with MAXScript quiet mode enabled, so modal dialogs cannot stall it,
+        and emits finished when done, whatever the outcome, so the UI is always restored.
+        """
+        status = "completed"
+        quiet_mode = None
+        try:
+            quiet_mode = self.callOnMainThread(lambda: runtime.getQuietMode())
+            self.callOnMainThread(lambda: runtime.setQuietMode(True))
+            self.processFiles()
+            if self.errors_occurred:
+                self.log("Processing completed with errors. Check the log for details.", level="WARNING")
+            else:
+                self.log("Processing finished successfully.", level="INFO")
+        except ProcessingAborted as e:
+            current_step, total_steps = e.args
+            aborted_percentage = (current_step) / total_steps * 100
+            self.log(f"Processing aborted at {aborted_percentage:.1f}%.", level="WARNING")
+            status = "aborted"
+        except Exception as e:
+            self.log(f"Processing failed: {e}", level="ERROR")
+            status = "failed"
+        finally:
+            if quiet_mode is not None:
+                try:
+                    self.callOnMainThread(lambda: runtime.setQuietMode(quiet_mode))
+                except Exception as e:
+                    self.log(f"Error restoring MAXScript quiet mode: {e}", level="ERROR")
+            self.finished.emit(status)
+
+    def processFiles(self):
+        """
+        Processes each 3ds Max file with the selected MAXScript files.
+
+        Raises:
+            ProcessingAborted: If an abort is requested.
+        """
+        max_script_files = self.max_script_files
+        max_files = self.max_files
+        start_time = time.time()
+        total_steps = len(max_files) * len(max_script_files)
+        if total_steps == 0:
+            self.log("No files to process.", level="WARNING")
+            return
+
+        current_step = 0
+
+        # Check all paths up front instead of once per 3ds Max file and MAXScript file pair
+        existing_files = findExistingFiles(max_files + max_script_files, self.io_pool)
+
+        # Look up the pymxs functions once, on the main thread, instead of on every call
+        load_max_file, save_max_file, disable_scene_redraw, enable_scene_redraw, complete_redraw = self.callOnMainThread(
+            lambda: (runtime.loadMaxFile, runtime.saveMaxFile, runtime.disableSceneRedraw, runtime.enableSceneRedraw, runtime.completeRedraw)
+        )
+        run_max_script_file = self.runMaxScriptFile
+        save_files = self.save_max_file
+
+        for i, max_file in enumerate(max_files):
+            if self.abort_event.is_set():
+                raise ProcessingAborted(current_step, total_steps)
+
+            if max_file not in existing_files:
+                self.log(f"3ds Max file not found: {max_file}", level="ERROR")
+                self.errors_occurred = True
+                continue  # Skip to next file
+
+            # Each 3ds Max file is loaded once and stays resident while all MAXScript files run on it
+            try:
+                self.log(f"Loading 3ds Max file: {max_file}", level="LOADING")
+                self.callOnMainThread(load_max_file, max_file, missingDllAction='quiet', useFileUnits=True, paint=True)
+            except Exception as e:
+                self.log(f"Error loading '{max_file}': {e}", level="ERROR")
+                self.errors_occurred = True  # Mark that an error occurred
+                continue  # Skip to next file
+
+            # Skip viewport redraws between scripts
+            self.callOnMainThread(disable_scene_redraw)
+            try:
+                for max_script_file in max_script_files:
+                    if self.abort_event.is_set():
+                        raise ProcessingAborted(current_step, total_steps)
+
+                    if max_script_file not in existing_files:
+                        self.log(f"MAXScript file not found: {max_script_file}", level="ERROR")
+                        self.errors_occurred = True
+                        continue  # Skip to next script
+
+                    try:
+                        self.log(f"Running MAXScript file: {max_script_file}", level="RUNNING")
+                        script_aborted = self.callOnMainThread(run_max_script_file, max_script_file, paint=True)
+                    except Exception as e:
+                        self.log(f"Error executing '{max_script_file}': {e}", level="ERROR")
+                        self.errors_occurred = True  # Mark that an error occurred
+                        continue
+                    if script_aborted:
+                        self.log(f"Execution aborted during script: {max_script_file}", level="WARNING")
+                        raise ProcessingAborted(current_step, total_steps)
+
+                    # Update progress after each MAXScript file
+                    current_step += 1
+                    self.reportProgress(current_step, total_steps, start_time)
+
+                    if self.abort_event.is_set():
+                        raise ProcessingAborted(current_step, total_steps)
+            finally:
+                self.callOnMainThread(enable_scene_redraw)
+                self.callOnMainThread(complete_redraw)
+
+            if save_files and not self.abort_event.is_set():
+                try:
+                    self.log(f"Saving 3ds Max file: {max_file}", level="SAVING")
+                    self.callOnMainThread(save_max_file, max_file, paint=True)
+                except Exception as e:
+                    self.log(f"Error saving '{max_file}': {e}", level="ERROR")
+                    self.errors_occurred = True  # Mark that an error occurred
+
+        self.reportProgress(current_step, total_steps, start_time, force=True)
+
+class ParallelBatchWorker(BatchWorker):
+    """
+    Processes several 3ds Max files at the same time, each one in its own headless
+    3dsmaxbatch.exe process. All MAXScript files are chained in one generated script
+    that is run on every 3ds Max file.
+    """
+    # MAXScript run by 3dsmaxbatch.exe on each 3ds Max file.
+    # Each process starts a fresh MAXScript session, so g_abortRequested is defined here for the scripts that test it.
+    BATCH_SCRIPT_TEMPLATE = """-- Generated by MAXScript Batch Tool
+global g_abortRequested = false
+(
+    local failed = 0
+    for f in #({scripts}) do
+    (
+        try (fileIn f) catch
+        (
+            failed += 1
+            format "Error executing '%': %\\n" f (getCurrentException())
+        )
+    )
+    {save}
+    if failed > 0 do throw (failed as string + " MAXScript file(s) failed")
+)
+"""
+    SAVE_SCRIPT = "saveMaxFile (maxFilePath + maxFileName) quiet:true"
+
+    def __init__(self, max_script_files, max_files, save_max_file, abort_event, io_pool, worker_count, parent=None):
+        super().__init__(max_script_files, max_files, save_max_file, abort_event, io_pool, parent)
+        self.worker_count = worker_count
+        self.processes = set()  # Running 3dsmaxbatch.exe processes
+        self.processes_lock = threading.Lock()
+
+    def runBatchProcess(self, command):
+        """
+        Runs a 3dsmaxbatch.exe process and waits for it to exit. Runs on a pool thread.
+
+        Args:
+            command (list): The command line to run.
+
+        Returns:
+            tuple: The return code and the output of the process.
+        """
+        if self.abort_event.is_set():
+            return None, ""
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors='replace',
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+        )
+        with self.processes_lock:
+            self.processes.add(process)
+            if self.abort_event.is_set():
+                process.terminate()  # Abort was requested while the process was starting
+        try:
+            output, _ = process.communicate()
+        finally:
+            with self.processes_lock:
+                self.processes.discard(process)
+        return process.returncode, output
+
+    def terminateProcesses(self):
+        """
+        Terminates every running 3dsmaxbatch.exe process.
+        """
+        with self.processes_lock:
+            for process in self.processes:
+                process.terminate()
+
+    def processFiles(self):
+        """
+        Processes the 3ds Max files in parallel 3dsmaxbatch.exe processes.
+
+        Raises:
+            ProcessingAborted: If an abort is requested.
+        """
+        max_root = self.callOnMainThread(lambda: runtime.getDir(runtime.Name('maxroot')))
+        batch_exe = os.path.join(max_root, '3dsmaxbatch.exe')
+        if not os.path.isfile(batch_exe):
+            self.log(f"3dsmaxbatch.exe not found: {batch_exe}. Processing in this session instead.", level="WARNING")
+            super().processFiles()
+            return
+
+        existing_files = findExistingFiles(self.max_files + self.max_script_files, self.io_pool)
+        max_script_files = []
+        for max_script_file in self.max_script_files:
+            if max_script_file in existing_files:
+                max_script_files.append(max_script_file)
+            else:
+                self.log(f"MAXScript file not found: {max_script_file}", level="ERROR")
+                self.errors_occurred = True
+        if not max_script_files:
+            self.log("No files to process.", level="WARNING")
+            return
+
+        scripts = ", ".join(f'@"{max_script_file}"' for max_script_file in max_script_files)
+        save = self.SAVE_SCRIPT if self.save_max_file else ""
+        start_time = time.time()
+        total_steps = len(self.max_files) * len(max_script_files)
+        current_step = 0
+        script_path = None
+        try:
+            script_fd, script_path = tempfile.mkstemp(suffix='.ms', prefix='MAXScriptBatchTool_')
+            # UTF-8 with a byte order mark, so 3ds Max reads paths outside the ANSI code page correctly
+            with os.fdopen(script_fd, 'w', encoding='utf-8-sig') as script_file:
+                script_file.write(self.BATCH_SCRIPT_TEMPLATE.format(scripts=scripts, save=save))
+
+            with ThreadPoolExecutor(max_workers=self.worker_count) as executor:
+                pending = {}
+                for max_file in self.max_files:
+                    if max_file not in existing_files:
+                        self.log(f"3ds Max file not found: {max_file}", level="ERROR")
+                        self.errors_occurred = True
+                        continue
+                    command = [batch_exe, script_path, '-sceneFile', max_file]
+                    pending[executor.submit(self.runBatchProcess, command)] = max_file
+                self.log(f"Running {len(pending)} 3ds Max files in up to {self.worker_count} 3dsmaxbatch.exe processes.", level="RUNNING")
+
+                while pending:
+                    if self.abort_event.is_set():
+                        for future in pending:
+                            future.cancel()
+                        self.terminateProcesses()
+                        raise ProcessingAborted(current_step, total_steps)
+                    done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        max_file = pending.pop(future)
+                        try:
+                            return_code, output = future.result()
+                        except Exception as e:
+                            self.log(f"Error running 3dsmaxbatch.exe on '{max_file}': {e}", level="ERROR")
+                            self.errors_occurred = True
+                            continue
+                        if return_code is None:
+                            continue  # Skipped after an abort request
+                        if return_code == 0:
+                            level = "SAVING" if self.save_max_file else "RUNNING"
+                            self.log(f"Processed 3ds Max file: {max_file}", level=level)
+                        else:
+                            self.log(f"Error processing '{max_file}' (exit code {return_code}): {output.strip()[-500:]}", level="ERROR")
+                            self.errors_occurred = True
+                        current_step += len(max_script_files)
+                        self.reportProgress(current_step, total_steps, start_time)
+        finally:
+            if script_path is not None:
+                os.remove(script_path)
+
+        self.reportProgress(current_step, total_steps, start_time, force=True)
+
 class FileBrowser(QWidget):
+    PROGRESS_TITLE = "Progress: {:.1f}%, ~ {:02d}:{:02d}:{:02d} remaining"  # Title of the progress group box during processing
+    LOG_MAX_LINES = 5000  # Number of lines kept in the log output and its pending buffer
+    LIST_FONT = None  # Font shared by the file lists, created in initUI once a QApplication exists
+    LEVEL_COLORS = {
+        "INFO": "#FFFFFF",     # White
+        "LOADING": "#5b8fe3",  # Blue
+        "RUNNING": "#96df5a",  # Green
+        "SAVING": "#ae7fb5",   # Purple
+        "WARNING": "#ffc966",  # Yellow
+        "ERROR": "#ff8566"     # Red
+    }  # Log text color of each logging level
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.save_max_file = False  # Flag to save .max files after processing
-        self.stopButtonPressed = False  # Flag for the "Abort" button
-        self.errors_occurred = False  # Flag to track if any errors occurred
+        self.abort_event = threading.Event()  # Set by the "Abort" button, checked by the BatchWorker
+        self.worker = None  # BatchWorker of the running batch
+        self.worker_thread = None  # QThread the BatchWorker runs on
+        self.list_file_loader = None  # ListFileLoader reading a list file in the background
+        self.last_progress_value = -1  # Last whole percentage shown in the progress bar
+        self.last_progress_title_time = 0.0  # Monotonic time of the last progress title update
+        self.progress_changed = False  # Whether the progress changed since it was last painted before a long call
+        self.last_paint_time = 0.0  # Monotonic time of the last paint before a long call
+        self.io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS)  # Reused for file existence checks
+        # (epoch second, level, message) entries waiting to be written to the log output,
+        # older entries are dropped since the log output would discard them anyway
+        self.log_buffer = collections.deque(maxlen=self.LOG_MAX_LINES)
+        self.log_second = None  # Second of the cached log timestamp
+        self.log_timestamp = ""  # Cached bracketed log timestamp, formatted once per second
+
+        # Build the text formats of each logging level once: a bold one for the timestamp and one for the message
+        self.log_formats = {}
+        for level, color in self.LEVEL_COLORS.items():
+            message_format = QTextCharFormat()
+            message_format.setForeground(QColor(color))
+            timestamp_format = QTextCharFormat(message_format)
+            timestamp_format.setFontWeight(QFont.Bold)
+            self.log_formats[level] = (timestamp_format, message_format)
         self.initUI()  # Initialize UI components
 
     def initUI(self):
@@ -107,10 +847,14 @@ class FileBrowser(QWidget):
         # Set window flags
         self.setWindowFlags(Qt.Window)
 
+        if FileBrowser.LIST_FONT is None:
+            FileBrowser.LIST_FONT = QFont("Consolas", 10)
+
         main_splitter = QSplitter(Qt.Horizontal)
 
         # Create left splitter with two group boxes for MAXScript and 3ds Max files
         left_splitter = QSplitter(Qt.Vertical)
+        self.group_box_buttons = []  # Browse and clear buttons of the group boxes, filled by createGroupBox
         self.maxscript_group_box, self.maxscript_list_widget = self.createGroupBox(
             "MAXScript files - 0", self.browseMaxScriptFiles, self.clearMaxScriptFiles, self.showMaxScriptContextMenu, 'maxscript'
         )
@@ -136,6 +880,14 @@ class FileBrowser(QWidget):
         self.save_max_checkbox.setToolTip("When enabled, 3ds Max files will be saved after the execution of each MAXScript file.")
         top_row_layout.addWidget(self.save_max_checkbox)
 
+        parallel_workers_label = QLabel("Parallel workers:")
+        top_row_layout.addWidget(parallel_workers_label)
+        self.parallel_workers_spinbox = QSpinBox()
+        self.parallel_workers_spinbox.setRange(1, os.cpu_count() or 1)
+        self.parallel_workers_spinbox.setValue(1)
+        self.parallel_workers_spinbox.setToolTip("Number of 3ds Max files processed at the same time in separate 3dsmaxbatch.exe processes. 1 processes them in this 3ds Max session.")
+        top_row_layout.addWidget(self.parallel_workers_spinbox)
+
         self.browse_list_file_button = QPushButton("Browse List File")
         self.browse_list_file_button.clicked.connect(self.browseListFile)
         self.browse_list_file_button.setStyleSheet("QPushButton { font-weight: bold; }")
@@ -183,13 +935,28 @@ class FileBrowser(QWidget):
         self.progress_group_box.setLayout(progress_layout)
         right_layout.addWidget(self.progress_group_box)
 
-        self.log_output = QTextEdit()
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(self.LOG_MAX_LINES)  # Keep only the latest lines to bound memory during long batches
+        self.log_output.setUndoRedoEnabled(False)  # The log is read-only, so skip recording every append on the undo stack
+        self.log_scroll_bar = self.log_output.verticalScrollBar()  # Looked up once, used on every flush
         self.log_output.setContextMenuPolicy(Qt.CustomContextMenu)
         self.log_output.customContextMenuRequested.connect(self.showLogContextMenu)
         self.log_output.setToolTip("Displays log messages. Right-click for options.")
         right_layout.addWidget(self.log_output)
 
+        # Reusable file dialog, keeps its model and directory cache between calls
+        self.file_dialog = QFileDialog(self)
+        self.file_dialog.setFileMode(QFileDialog.ExistingFiles)
+        self.file_dialog.setOption(QFileDialog.DontResolveSymlinks, True)
+        self.file_dialog.setOption(QFileDialog.ReadOnly, True)
+
+        # Flush buffered log messages to the log output in batches
+        self.log_timer = QTimer(self)
+        self.log_timer.setInterval(80)
+        self.log_timer.timeout.connect(self.flushLog)
+        self.log_timer.start()
+
         right_widget = QWidget()
         right_widget.setLayout(right_layout)
         main_splitter.addWidget(right_widget)
@@ -204,6 +971,7 @@ class FileBrowser(QWidget):
     def createGroupBox(self, title, browse_func, clear_func, context_menu_func, file_type):
         """
         Creates a group box with a list widget, browse, and clear buttons.
+        The buttons are added to group_box_buttons so they can be toggled during processing.
 
         Args:
             title (str): The title of the group box.
@@ -218,14 +986,11 @@ class FileBrowser(QWidget):
         group_box = QGroupBox(title)
         group_box.setToolTip(f"List of {'MAXScript' if file_type == 'maxscript' else '3ds Max'} files to process.")
         layout = QVBoxLayout()
-        label = QLabel("File Names  /  Directory Paths")
-        label.setStyleSheet("color: gray;")
-        layout.addWidget(label)
         list_widget = FileListWidget()
         list_widget.setContextMenuPolicy(Qt.CustomContextMenu)  # Added line
         list_widget.setDragDropMode(QAbstractItemView.InternalMove)
         list_widget.customContextMenuRequested.connect(context_menu_func)
-        list_widget.setFont(QFont("Consolas", 10))
+        list_widget.setFont(self.LIST_FONT)
         list_widget.setSelectionMode(QAbstractItemView.ExtendedSelection)
         list_widget.fileDropped.connect(lambda files, lw=list_widget: self.handleFilesDropped(files, lw, file_type))
         list_widget.removeRequested.connect(lambda lw=list_widget: self.removeSelectedItems(lw))
@@ -244,6 +1009,7 @@ class FileBrowser(QWidget):
         button_layout.addWidget(clear_button)
         layout.addLayout(button_layout)
         group_box.setLayout(layout)
+        self.group_box_buttons.extend([browse_button, clear_button])
         return group_box, list_widget
 
     def handleFilesDropped(self, files, list_widget, file_type):
@@ -252,14 +1018,14 @@ class FileBrowser(QWidget):
 
         Args:
             files (list): List of file paths.
-            list_widget (QListWidget): The list widget to add files to.
+            list_widget (FileListWidget): The list widget to add files to.
             file_type (str): The type of files expected ('maxscript' or 'max').
         """
-        # Filter files based on file_type
+        # Filter files based on file_type, lowering only the suffix instead of the whole path
         if file_type == 'maxscript':
-            filtered_files = [f for f in files if f.lower().endswith('.ms')]
+            filtered_files = [f for f in files if f[-3:].lower() == '.ms']
         elif file_type == 'max':
-            filtered_files = [f for f in files if f.lower().endswith('.max')]
+            filtered_files = [f for f in files if f[-4:].lower() == '.max']
         else:
             filtered_files = files  # No filtering
 
@@ -274,41 +1040,59 @@ class FileBrowser(QWidget):
         """
         Updates the titles of the group boxes with the count of items.
         """
-        self.maxscript_group_box.setTitle(f"MAXScript files - {self.maxscript_list_widget.count()}")
-        self.max_group_box.setTitle(f"3ds Max files - {self.max_list_widget.count()}")
+        self.maxscript_group_box.setTitle(f"MAXScript files - {self.maxscript_list_widget.path_model.rowCount()}")
+        self.max_group_box.setTitle(f"3ds Max files - {self.max_list_widget.path_model.rowCount()}")
 
     def log(self, message, level="INFO"):
         """
-        Appends a message to the log output with a specific color based on the logging level.
-        Includes a timestamp for each message.
+        Buffers a message for the log output. The message is timestamped now and formatted
+        with the color of its logging level when flushLog writes it.
 
         Args:
             message (str): The message to log.
             level (str): The logging level ('INFO', 'LOADING', 'RUNNING', 'SAVING', 'WARNING', 'ERROR').
         """
-        color_map = {
-            "INFO": "#FFFFFF",     # White
-            "LOADING": "#5b8fe3",  # Blue
-            "RUNNING": "#96df5a",  # Green
-            "SAVING": "#ae7fb5",   # Purple
-            "WARNING": "#ffc966",  # Yellow
-            "ERROR": "#ff8566"     # Red
-        }
-        text_color = color_map.get(level, "#FFFFFF")
-        timestamp = time.strftime("%H:%M:%S", time.localtime())
-        
-        # Create styled timestamp in bold
-        styled_timestamp = f'<span style="font-weight:bold;">[{timestamp}]</span>'
-        
-        # Combine styled timestamp with unstyled message and assain color
-        full_message = f'<span style="color:{text_color};">{styled_timestamp} {message}</span>'
-        
-        # Append to log_output
-        self.log_output.append(full_message)
-        
-        # Scroll to the end
-        self.log_output.verticalScrollBar().setValue(self.log_output.verticalScrollBar().maximum())
-        QApplication.processEvents()
+        self.log_buffer.append((int(time.time()), level, message))
+
+    def flushLog(self):
+        """
+        Writes all buffered log messages to the log output in a single edit block.
+        The text is inserted with prebuilt character formats, without going through the HTML parser.
+        Each message becomes its own block so the maximum block count applies per line.
+
+        Returns:
+            bool: True if any message was written.
+        """
+        if not self.log_buffer:
+            return False
+
+        # Only follow new messages if the user has not scrolled up to read older ones
+        scroll_bar = self.log_scroll_bar
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+
+        document = self.log_output.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        new_block = not document.isEmpty()
+        for second, level, message in self.log_buffer:
+            # Format the timestamp only when the second changes
+            if second != self.log_second:
+                self.log_second = second
+                self.log_timestamp = f"[{time.strftime('%H:%M:%S', time.localtime(second))}]"
+
+            timestamp_format, message_format = self.log_formats.get(level) or self.log_formats["INFO"]
+            if new_block:
+                cursor.insertBlock()
+            new_block = True
+            cursor.insertText(self.log_timestamp, timestamp_format)
+            cursor.insertText(" " + message, message_format)
+        cursor.endEditBlock()
+        self.log_buffer.clear()
+
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
+        return True
 
     def browseFiles(self, file_type, filter_text, list_widget):
         """
@@ -317,9 +1101,13 @@ class FileBrowser(QWidget):
         Args:
             file_type (str): The type of files to display in the dialog title.
             filter_text (str): The file filter for the dialog.
-            list_widget (QListWidget): The list widget to add the files to.
+            list_widget (FileListWidget): The list widget to add the files to.
         """
-        files, _ = QFileDialog.getOpenFileNames(self, f"Select {file_type}", "", filter_text)
+        self.file_dialog.setWindowTitle(f"Select {file_type}")
+        self.file_dialog.setNameFilter(filter_text)
+        if not self.file_dialog.exec_():
+            return
+        files = self.file_dialog.selectedFiles()
         if files:
             self.addFilesToListWidget(files, list_widget)
             self.updateGroupBoxTitles()
@@ -327,21 +1115,64 @@ class FileBrowser(QWidget):
 
     def browseListFile(self):
         """
-        Opens a file dialog to select a list file and processes it to extract file paths.
+        Opens a file dialog to select a list file and loads the file paths it contains in the background.
         """
+        if self.list_file_loader is not None:
+            return  # A list file is still loading
         list_file, _ = QFileDialog.getOpenFileName(self, "Select List File", "", "Text Files (*.txt)")
         if list_file:
-            with open(list_file, 'r') as file:
-                content = file.read()
-                # Use regex to extract paths, handling quotes and different separators
-                paths = re.findall(r'"([^"]+)"|\S+', content.replace('\\', '/'))
-                max_files = [path for path in paths if path.endswith('.max') and Path(path).exists()]
-                ms_files = [path for path in paths if path.endswith('.ms') and Path(path).exists()]
-                self.addFilesToListWidget(ms_files, self.maxscript_list_widget)
-                self.addFilesToListWidget(max_files, self.max_list_widget)
-                self.updateGroupBoxTitles()
-                total_files = len(ms_files) + len(max_files)
-                self.log(f"Loaded {total_files} files from list.", level="INFO")
+            # Snapshot the listed paths, the lists may change while the loader runs
+            self.list_file_loader = ListFileLoader(
+                list_file,
+                frozenset(self.max_list_widget.path_model.normalized_paths),
+                frozenset(self.maxscript_list_widget.path_model.normalized_paths),
+                self.io_pool
+            )
+            self.list_file_loader.signals.finished.connect(self.handleListFileLoaded)
+            self.list_file_loader.signals.failed.connect(self.handleListFileFailed)
+
+            # Keep a batch from starting on half-loaded lists
+            self.browse_list_file_button.setEnabled(False)
+            self.process_button_all.setEnabled(False)
+            self.log(f"Loading list file: {list_file}", level="INFO")
+            QThreadPool.globalInstance().start(self.list_file_loader)
+
+    @Slot(object)
+    def handleListFileLoaded(self, result):
+        """
+        Adds the files found by the ListFileLoader to the list widgets.
+
+        Args:
+            result (tuple): The new 3ds Max files, the new MAXScript files and the number of files already listed.
+        """
+        max_files, ms_files, listed_count = result
+        self.finishListFileLoad()
+        if listed_count:
+            self.log(f"Skipped {listed_count} files already in the lists.", level="INFO")
+        self.addFilesToListWidget(ms_files, self.maxscript_list_widget)
+        self.addFilesToListWidget(max_files, self.max_list_widget)
+        self.updateGroupBoxTitles()
+        total_files = len(ms_files) + len(max_files)
+        self.log(f"Loaded {total_files} files from list.", level="INFO")
+
+    @Slot(str)
+    def handleListFileFailed(self, error):
+        """
+        Reports a list file that could not be read.
+
+        Args:
+            error (str): The error message.
+        """
+        self.finishListFileLoad()
+        self.log(f"Error reading list file: {error}", level="ERROR")
+
+    def finishListFileLoad(self):
+        """
+        Releases the ListFileLoader and enables the controls disabled while it ran.
+        """
+        self.list_file_loader = None
+        self.browse_list_file_button.setEnabled(True)
+        self.process_button_all.setEnabled(True)
 
     def browseMaxScriptFiles(self):
         """
@@ -358,59 +1189,27 @@ class FileBrowser(QWidget):
     def addFilesToListWidget(self, files, list_widget):
         """
         Adds selected files to the list widget, ensuring no duplicates.
-        Updates the padding for all items to align filenames and directory paths.
 
         Args:
             files (list): List of file paths to add.
-            list_widget (QListWidget): The list widget to add files to.
-        """
-        # Normalize existing file paths in the list widget
-        existing_files = []
-        for index in range(list_widget.count()):
-            item_file_path = list_widget.item(index).data(Qt.UserRole)
-            normalized_path = os.path.normcase(os.path.abspath(item_file_path))
-            existing_files.append(normalized_path)
-
-        # Prepare to determine the padding for filenames
-        # Include both existing and new files for padding calculation
-        all_file_paths = existing_files + [os.path.normcase(os.path.abspath(f)) for f in files]
-        basenames = [os.path.basename(file_path) for file_path in all_file_paths]
-        if basenames:
-            longest_filename = max(basenames, key=len)
-            length_of_longest = len(longest_filename)
-        else:
-            length_of_longest = 0
-
-        # Update existing items in the list widget with new padding
-        for index in range(list_widget.count()):
-            item = list_widget.item(index)
-            file_path = item.data(Qt.UserRole)
-            file_name = os.path.basename(file_path)
-            file_name_padded = file_name.ljust(length_of_longest + 5)
-            dir_path = os.path.dirname(file_path)
-            item.setText(f"{file_name_padded}{dir_path}")
-
-        # Add new files to the list widget if they are not already present
-        for file_path in files:
-            normalized_new_file = os.path.normcase(os.path.abspath(file_path))
-            if normalized_new_file not in existing_files:
-                file_name = os.path.basename(file_path)
-                file_name_padded = file_name.ljust(length_of_longest + 5)
-                dir_path = os.path.dirname(file_path)
-                list_item = QListWidgetItem(f"{file_name_padded}{dir_path}")
-                list_item.setData(Qt.UserRole, file_path)
-                list_widget.addItem(list_item)
-            else:
-                self.log(f"File already in the list: {file_path}", level="INFO")
+            list_widget (FileListWidget): The list widget to add files to.
+        """
+        # Insert all new paths at once, the model skips the ones already present
+        row_count = list_widget.path_model.rowCount()
+        duplicates = list_widget.path_model.addPaths(files)
+        for file_path in duplicates:
+            self.log(f"File already in the list: {file_path}", level="INFO")
+        if list_widget.path_model.rowCount() != row_count:
+            list_widget.fitColumns()
 
     def clearListWidget(self, list_widget):
         """
         Clears all items from the specified list widget.
 
         Args:
-            list_widget (QListWidget): The list widget to clear.
+            list_widget (FileListWidget): The list widget to clear.
         """
-        list_widget.clear()
+        list_widget.path_model.clear()
         self.updateGroupBoxTitles()
         self.log("Cleared the list.", level="INFO")
 
@@ -441,7 +1240,7 @@ class FileBrowser(QWidget):
         """
         Signals to stop processing.
         """
-        self.stopButtonPressed = True
+        self.abort_event.set()
         runtime.g_abortRequested = True  # Set the abort flag in runtime
         self.log("Abort requested. The process will stop after the current operation.", level="WARNING")
 
@@ -470,12 +1269,12 @@ class FileBrowser(QWidget):
         self.maxscript_list_widget.setEnabled(False)
         self.max_list_widget.setEnabled(False)
         self.save_max_checkbox.setEnabled(False)
+        self.parallel_workers_spinbox.setEnabled(False)
         self.browse_list_file_button.setEnabled(False)
 
         # Disable browse and clear buttons
-        for group_box in [self.maxscript_group_box, self.max_group_box]:
-            for button in group_box.findChildren(QPushButton):
-                button.setEnabled(False)
+        for button in self.group_box_buttons:
+            button.setEnabled(False)
 
     def revealeElements(self):
         """
@@ -486,130 +1285,114 @@ class FileBrowser(QWidget):
         self.maxscript_list_widget.setEnabled(True)
         self.max_list_widget.setEnabled(True)
         self.save_max_checkbox.setEnabled(True)
+        self.parallel_workers_spinbox.setEnabled(True)
         self.browse_list_file_button.setEnabled(True)
 
         # Enable browse and clear buttons
-        for group_box in [self.maxscript_group_box, self.max_group_box]:
-            for button in group_box.findChildren(QPushButton):
-                button.setEnabled(True)
+        for button in self.group_box_buttons:
+            button.setEnabled(True)
 
     def processAll(self):
         """
         Initiates the processing of all selected MAXScript and 3ds Max files.
-        Validates the input lists and starts the processing.
+        Validates the input lists and starts the processing on a worker thread.
         """
         self.hideElements()
-        self.stopButtonPressed = False  # Reset the stop button flag
+        self.abort_event.clear()  # Reset the abort flag
         runtime.g_abortRequested = False  # Reset the abort flag in runtime
-        self.errors_occurred = False  # Reset the error flag
 
-        if self.maxscript_list_widget.count() == 0 or self.max_list_widget.count() == 0:
+        if self.maxscript_list_widget.path_model.rowCount() == 0 or self.max_list_widget.path_model.rowCount() == 0:
             QMessageBox.warning(self, "Warning", "MAXScript or 3ds Max file lists are empty!")
             self.revealeElements()
             return
 
-        max_script_files = [self.maxscript_list_widget.item(index).data(Qt.UserRole) for index in range(self.maxscript_list_widget.count())]
-        max_files = [self.max_list_widget.item(index).data(Qt.UserRole) for index in range(self.max_list_widget.count())]
+        max_script_files = list(self.maxscript_list_widget.path_model.paths)
+        max_files = list(self.max_list_widget.path_model.paths)
 
         # Start processing without pre-validating file paths
         self.log(f"Starting processing of {len(max_files)} 3ds Max files with {len(max_script_files)} MAXScript files.", level="INFO")
 
         # Start processing
-        self.processFiles(max_script_files, max_files, self.save_max_file)
-        self.revealeElements()
-        self.progress_bar.setValue(0)  # Reset progress bar after processing
+        self.processFiles(max_script_files, max_files, self.save_max_file, self.parallel_workers_spinbox.value())
 
-    def processFiles(self, max_script_files, max_files, save_max_file):
+    def processFiles(self, max_script_files, max_files, save_max_file, worker_count=1):
         """
-        Processes each 3ds Max file with the selected MAXScript files.
-        """
-        start_time = time.time()
-        total_steps = len(max_files) * len(max_script_files)
-        if total_steps == 0:
-            self.log("No files to process.", level="WARNING")
-            self.progress_bar.setValue(0)
-            self.progress_group_box.setTitle(f"Progress:")
-            return
-
-        current_step = 0
-
-        for i, max_file in enumerate(max_files):
-            if self.stopButtonPressed:
-                self.stopButtonPressed = False
-                runtime.g_abortRequested = False  # Reset the abort flag in runtime
-                aborted_percentage = (current_step) / total_steps * 100
-                QMessageBox.information(self, "Aborted!", "Processing 3ds Max files aborted!")
-                self.progress_bar.setValue(0)
-                self.progress_group_box.setTitle(f"Progress:")
-                self.log(f"Processing aborted at {aborted_percentage:.1f}%.", level="WARNING")
-                return
-
-            if not os.path.exists(max_file):
-                self.log(f"3ds Max file not found: {max_file}", level="ERROR")
-                self.errors_occurred = True
-                continue  # Skip to next file
+        Starts a BatchWorker on a separate thread to process each 3ds Max file with the selected MAXScript files.
 
-            try:
-                self.log(f"Loading 3ds Max file: {max_file}", level="LOADING")
-                QApplication.processEvents()
-                runtime.loadMaxFile(max_file, missingDllAction='quiet', useFileUnits=True)
-            except Exception as e:
-                self.log(f"Error loading '{max_file}': {e}", level="ERROR")
-                self.errors_occurred = True  # Mark that an error occurred
-                continue  # Skip to next file
-
-            for max_script_file in max_script_files:
-                if self.stopButtonPressed:
-                    break  # Exit the scripts loop
-
-                if not os.path.exists(max_script_file):
-                    self.log(f"MAXScript file not found: {max_script_file}", level="ERROR")
-                    self.errors_occurred = True
-                    continue  # Skip to next script
+        Args:
+            max_script_files (list): MAXScript files to execute.
+            max_files (list): 3ds Max files to process.
+            save_max_file (bool): Whether to save the 3ds Max files after processing.
+            worker_count (int): Number of 3dsmaxbatch.exe processes to run at the same time. 1 processes the files in this session.
+        """
+        self.last_progress_value = -1
+        self.last_progress_title_time = 0.0
+        self.progress_changed = False
+        self.last_paint_time = 0.0
+        self.worker_thread = QThread(self)
+        if worker_count > 1:
+            self.worker = ParallelBatchWorker(max_script_files, max_files, save_max_file, self.abort_event, self.io_pool, worker_count)
+        else:
+            self.worker = BatchWorker(max_script_files, max_files, save_max_file, self.abort_event, self.io_pool)
+        self.worker.moveToThread(self.worker_thread)
+        self.worker_thread.started.connect(self.worker.run)
+        self.worker.progress.connect(self.updateProgress, Qt.QueuedConnection)
+        self.worker.logMessage.connect(self.log, Qt.QueuedConnection)
+        self.worker.invokeRequested.connect(self.runOnMainThread, Qt.BlockingQueuedConnection)
+        self.worker.finished.connect(self.handleProcessingFinished, Qt.QueuedConnection)
+        self.worker.finished.connect(self.worker_thread.quit)
+        self.worker_thread.finished.connect(self.cleanupWorker)
+        self.worker_thread.start()
+
+    @Slot(object, bool)
+    def runOnMainThread(self, call, paint):
+        """
+        Runs a callable requested by the BatchWorker on the main thread.
+        Long pymxs calls block the event loop until they return, so the log and progress can be painted first.
 
-                try:
-                    self.log(f"Running MAXScript file: {max_script_file}", level="RUNNING")
-                    QApplication.processEvents()
-                    runtime.fileIn(max_script_file)
-                    if runtime.g_abortRequested:
-                        self.log(f"Execution aborted during script: {max_script_file}", level="WARNING")
-                        break  # Exit the scripts loop
-                except Exception as e:
-                    self.log(f"Error executing '{max_script_file}': {e}", level="ERROR")
-                    self.errors_occurred = True  # Mark that an error occurred
-                    continue
-
-                # Update progress after each MAXScript file
-                current_step += 1
-                self.updateProgress(current_step, total_steps, start_time)
-                QApplication.processEvents()
-
-                if self.stopButtonPressed:
-                    runtime.g_abortRequested = False  # Reset the abort flag in runtime
-                    aborted_percentage = (current_step) / total_steps * 100
-                    QMessageBox.information(self, "Aborted!", "Processing 3ds Max files aborted!")
-                    self.progress_bar.setValue(0)
-                    self.progress_group_box.setTitle(f"Progress:")
-                    self.log(f"Processing aborted at {aborted_percentage:.1f}%.", level="WARNING")
-                    return
-
-            if save_max_file and not self.stopButtonPressed:
-                try:
-                    self.log(f"Saving 3ds Max file: {max_file}", level="SAVING")
-                    QApplication.processEvents()
-                    runtime.saveMaxFile(max_file)
-                except Exception as e:
-                    self.log(f"Error saving '{max_file}': {e}", level="ERROR")
-                    self.errors_occurred = True  # Mark that an error occurred
+        Args:
+            call (callable): The callable to run.
+            paint (bool): Whether to paint the log and progress first, at most once per PROGRESS_INTERVAL seconds.
+        """
+        now = time.monotonic()
+        if paint and now - self.last_paint_time >= BatchWorker.PROGRESS_INTERVAL:
+            self.last_paint_time = now
+            # The worker's queued log and progress signals are delivered before this call, so show the current step now
+            if self.flushLog():
+                self.log_output.viewport().repaint()
+            if self.progress_changed:
+                self.progress_changed = False
+                self.progress_group_box.repaint()
+        call()
+
+    @Slot(str)
+    def handleProcessingFinished(self, status):
+        """
+        Restores the UI once the BatchWorker is done.
 
-        if self.errors_occurred:
-            self.log("Processing completed with errors. Check the log for details.", level="WARNING")
+        Args:
+            status (str): How the processing ended: "completed", "aborted" or "failed".
+        """
+        self.flushLog()
+        if status == "aborted":
+            runtime.g_abortRequested = False  # Reset the abort flag in runtime
+            QMessageBox.information(self, "Aborted!", "Processing 3ds Max files aborted!")
+        elif status == "failed":
+            QMessageBox.warning(self, "Failed!", "Processing 3ds Max files failed! Check the log for details.")
         else:
-            self.log("Processing finished successfully.", level="INFO")
-
-        QMessageBox.information(self, "Done!", "Processing 3ds Max files completed!")
-        self.progress_bar.setValue(0)
+            QMessageBox.information(self, "Done!", "Processing 3ds Max files completed!")
+        self.progress_bar.setValue(0)  # Reset progress bar after processing
         self.progress_group_box.setTitle(f"Progress:")
+        self.revealeElements()
+
+    @Slot()
+    def cleanupWorker(self):
+        """
+        Releases the BatchWorker and its thread once the thread has stopped.
+        """
+        self.worker_thread.deleteLater()
+        self.worker_thread = None
+        self.worker = None
 
     def updateProgress(self, current_step, total_steps, start_time):
         """
@@ -620,15 +1403,25 @@ class FileBrowser(QWidget):
             total_steps (int): The total number of steps in the process.
             start_time (float): The time when processing started.
         """
-        progress_value = (current_step) / total_steps * 100
+        # Only repaint the progress bar when the whole percentage changes
+        progress_value = current_step * 100 // total_steps
+        if progress_value != self.last_progress_value:
+            self.last_progress_value = progress_value
+            self.progress_bar.setValue(progress_value)
+            self.progress_changed = True
+
+        # Refresh the remaining time estimate at most once per second, and always at the end
+        now = time.monotonic()
+        if now - self.last_progress_title_time < 1.0 and current_step < total_steps:
+            return
+        self.last_progress_title_time = now
         elapsed_time = time.time() - start_time
         time_per_step = elapsed_time / current_step if current_step > 0 else 0
         remaining_steps = total_steps - current_step
         estimated_remaining_time = remaining_steps * time_per_step
         h, m, s = self.secondsToHMS(estimated_remaining_time)
-        self.progress_group_box.setTitle(f"Progress: {progress_value:.1f}%, ~ {int(h):02d}:{int(m):02d}:{int(s):02d} remaining")
-        self.progress_bar.setValue(progress_value)
-        QApplication.processEvents()
+        self.progress_group_box.setTitle(self.PROGRESS_TITLE.format(current_step / total_steps * 100, h, m, s))
+        self.progress_changed = True
 
     def secondsToHMS(self, seconds):
         """
@@ -640,9 +1433,8 @@ class FileBrowser(QWidget):
         Returns:
             tuple: A tuple containing hours, minutes, and seconds.
         """
-        hours = int(seconds) // 3600
-        minutes = (int(seconds) % 3600) // 60
-        seconds = int(seconds) % 60
+        hours, seconds = divmod(int(seconds), 3600)
+        minutes, seconds = divmod(seconds, 60)
         return hours, minutes, seconds
 
     def showContextMenu(self, pos, list_widget):
@@ -651,10 +1443,9 @@ class FileBrowser(QWidget):
 
         Args:
             pos (QPoint): The position where the context menu should appear.
-            list_widget (QListWidget): The list widget to interact with.
+            list_widget (FileListWidget): The list widget to interact with.
         """
-        selected_items = list_widget.selectedItems()
-        if selected_items:
+        if list_widget.selectionModel().hasSelection():
             menu = QMenu()
             remove_action = menu.addAction("Remove")
             remove_action.triggered.connect(lambda: self.removeSelectedItems(list_widget))
@@ -696,6 +1487,7 @@ class FileBrowser(QWidget):
 
     def clearLog(self):
         # Clears the log output.
+        self.log_buffer.clear()
         self.log_output.clear()
         self.log("Log cleared.", level="INFO")
 
@@ -711,11 +1503,11 @@ class FileBrowser(QWidget):
         Removes selected items from the specified list widget.
 
         Args:
-            list_widget (QListWidget): The list widget to remove items from.
+            list_widget (FileListWidget): The list widget to remove items from.
         """
-        count = len(list_widget.selectedItems())
-        for item in list_widget.selectedItems():
-            list_widget.takeItem(list_widget.row(item))
+        rows = list_widget.selectedRows()
+        list_widget.path_model.removePathRows(rows)
+        count = len(rows)
         self.updateGroupBoxTitles()
         self.log(f"Removed {count} items from the list.", level="INFO")
 